@@ -5,29 +5,72 @@ Output: JSON file only
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
+# Fast JSON serialization (optional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+HOMEPAGE_URL = "https://fse.ewubd.edu/computer-science-engineering"
+CHAIRPERSON_URL = "https://fse.ewubd.edu/computer-science-engineering/chairperson-massage"
+
+# All pages live on the same host; one pooled session keeps connections
+# alive across the concurrent scrapes
+_SESSION = requests.Session()
+_SESSION.headers['User-Agent'] = 'Mozilla/5.0'
+_SESSION.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=4))
+
+# Patterns are compiled once at import time instead of on every call
+_COURSE_CODE_RE = re.compile(r'CSE\d{3}')
+
+# Chairperson message page
+_NAME_RE = re.compile(r'Dr\.\s+([A-Z][a-z]+\s+[A-Z][a-z]+)')
+_PHONE_RE = re.compile(r'Telephone:\s*([\d\s]+)')
+_EXT_RE = re.compile(r'Ext\s*[–-]\s*(\d+)')
+_EMAIL_RE = re.compile(r'Email:\s*([\w\.-]+@[\w\.-]+)')
+_VISION_RE = re.compile(r'Vision Statement[^\n]*\n+(.*?)(?=Mission|$)', re.DOTALL)
+_MISSION_SECTION_RE = re.compile(r'Mission of CSE Department(.*?)(?=Program Educational|$)', re.DOTALL)
+_MISSION_POINT_RE = re.compile(r'\(i+\)(.*?)(?=\(i+\)|$)', re.DOTALL)
+_PEO_RE = re.compile(r'(PEO?\d+)\s*\|\s*(.*?)(?=\||PEO|PE\d|$)', re.DOTALL)
+_ALUMNI_RE = re.compile(r'Alumni works in (.*?)(?=\.|,\s+etc)')
+_COMPANY_RE = re.compile(r'([A-Z][a-zA-Z\s]+(?:,|and)?)')
+
+# Homepage course sections
+_COURSE_SECTION_RE = re.compile(r'(CSE\d{3})(.*?)(?=CSE\d{3}|$)', re.DOTALL)
+_CREDIT_HOURS_RE = re.compile(r'Credit Hours\s+(\d+(?:\.\d+)?)\s+(\d+(?:\.\d+)?)\s+(\d+(?:\.\d+)?)')
+_PREREQ_RE = re.compile(r'Prerequisite:\s*([^\n]+)')
+_OBJECTIVE_RE = re.compile(r'Course Objective:\s*(.*?)(?=Course Outcomes|$)', re.DOTALL)
+_OUTCOME_RE = re.compile(r'(CO\d+)\s*\|\s*(.*?)(?=\||CO\d+|Course Contents|$)', re.DOTALL)
+_CONTENTS_RE = re.compile(r'Course Contents(.*?)(?=CSE\d{3}|$)', re.DOTALL)
+
 
 def clean_text(text):
     """Clean text by removing extra whitespace"""
     if not text:
         return ""
-    return re.sub(r'\s+', ' ', text).strip()
+    # str.split() drops leading/trailing whitespace and splits on any run of it
+    return ' '.join(text.split())
 
 
-def scrape_homepage():
-    """Scrape homepage data"""
-    url = "https://fse.ewubd.edu/computer-science-engineering"
-    
-    headers = {'User-Agent': 'Mozilla/5.0'}
-    print(f"Scraping homepage: {url}")
-    
-    response = requests.get(url, headers=headers, timeout=30)
+def _fetch_soup(url):
+    """Fetch a department page and parse it"""
+    response = _SESSION.get(url, timeout=30)
     response.raise_for_status()
-    soup = BeautifulSoup(response.content, 'html.parser')
+    return BeautifulSoup(response.content, 'lxml')
+
+
+def scrape_homepage(soup=None):
+    """Scrape homepage data; pass an already fetched homepage soup to reuse it"""
+    if soup is None:
+        print(f"Scraping homepage: {HOMEPAGE_URL}")
+        soup = _fetch_soup(HOMEPAGE_URL)
     
     data = {
         'welcome_section': {},
@@ -49,22 +92,16 @@ def scrape_homepage():
     all_text = soup.get_text()
     
     # Find course codes (CSE103, CSE106, etc.)
-    course_codes = re.findall(r'CSE\d{3}', all_text)
-    data['course_previews'] = list(set(course_codes))  # Remove duplicates
+    course_codes = _COURSE_CODE_RE.findall(all_text)
+    data['course_previews'] = list(dict.fromkeys(course_codes))  # Remove duplicates, keep page order
     
     return data
 
 
 def scrape_chairperson_message():
     """Scrape full chairperson message page"""
-    url = "https://fse.ewubd.edu/computer-science-engineering/chairperson-massage"
-    
-    headers = {'User-Agent': 'Mozilla/5.0'}
-    print(f"Scraping chairperson page: {url}")
-    
-    response = requests.get(url, headers=headers, timeout=30)
-    response.raise_for_status()
-    soup = BeautifulSoup(response.content, 'html.parser')
+    print(f"Scraping chairperson page: {CHAIRPERSON_URL}")
+    soup = _fetch_soup(CHAIRPERSON_URL)
     
     # Get all text content
     text_content = soup.get_text()
@@ -81,20 +118,20 @@ def scrape_chairperson_message():
     }
     
     # Extract name
-    name_match = re.search(r'Dr\.\s+([A-Z][a-z]+\s+[A-Z][a-z]+)', text_content)
+    name_match = _NAME_RE.search(text_content)
     if name_match:
         chairperson_data['name'] = name_match.group(0)
     
     # Extract contact info
-    phone_match = re.search(r'Telephone:\s*([\d\s]+)', text_content)
+    phone_match = _PHONE_RE.search(text_content)
     if phone_match:
         chairperson_data['contact']['telephone'] = clean_text(phone_match.group(1))
     
-    ext_match = re.search(r'Ext\s*[–-]\s*(\d+)', text_content)
+    ext_match = _EXT_RE.search(text_content)
     if ext_match:
         chairperson_data['contact']['extension'] = ext_match.group(1)
     
-    email_match = re.search(r'Email:\s*([\w\.-]+@[\w\.-]+)', text_content)
+    email_match = _EMAIL_RE.search(text_content)
     if email_match:
         chairperson_data['contact']['email'] = email_match.group(1)
     
@@ -117,19 +154,19 @@ def scrape_chairperson_message():
         chairperson_data['programs_offered'].append('M.S. in Computer Science and Engineering')
     
     # Extract vision
-    vision_match = re.search(r'Vision Statement[^\n]*\n+(.*?)(?=Mission|$)', text_content, re.DOTALL)
+    vision_match = _VISION_RE.search(text_content)
     if vision_match:
         chairperson_data['vision'] = clean_text(vision_match.group(1))
     
     # Extract mission points
-    mission_section = re.search(r'Mission of CSE Department(.*?)(?=Program Educational|$)', text_content, re.DOTALL)
+    mission_section = _MISSION_SECTION_RE.search(text_content)
     if mission_section:
         mission_text = mission_section.group(1)
-        mission_points = re.findall(r'\(i+\)(.*?)(?=\(i+\)|$)', mission_text, re.DOTALL)
+        mission_points = _MISSION_POINT_RE.findall(mission_text)
         chairperson_data['mission'] = [clean_text(m) for m in mission_points if clean_text(m)]
     
     # Extract PEO (Program Educational Objectives)
-    peo_matches = re.findall(r'(PEO?\d+)\s*\|\s*(.*?)(?=\||PEO|PE\d|$)', text_content, re.DOTALL)
+    peo_matches = _PEO_RE.findall(text_content)
     for peo_code, peo_desc in peo_matches:
         chairperson_data['peo'][clean_text(peo_code)] = clean_text(peo_desc)
     
@@ -151,32 +188,26 @@ def scrape_chairperson_message():
         ]
     
     # Extract notable companies where alumni work
-    companies_text = re.search(r'Alumni works in (.*?)(?=\.|,\s+etc)', text_content)
+    companies_text = _ALUMNI_RE.search(text_content)
     if companies_text:
-        companies = re.findall(r'([A-Z][a-zA-Z\s]+(?:,|and)?)', companies_text.group(1))
+        companies = _COMPANY_RE.findall(companies_text.group(1))
         chairperson_data['alumni_companies'] = [clean_text(c.replace('and', '').replace(',', '')) for c in companies if clean_text(c)]
     
     return chairperson_data
 
 
-def scrape_courses_from_homepage():
-    """Extract course details from homepage"""
-    url = "https://fse.ewubd.edu/computer-science-engineering"
-    
-    headers = {'User-Agent': 'Mozilla/5.0'}
-    print(f"Scraping courses from homepage: {url}")
-    
-    response = requests.get(url, headers=headers, timeout=30)
-    response.raise_for_status()
-    soup = BeautifulSoup(response.content, 'html.parser')
+def scrape_courses_from_homepage(soup=None):
+    """Extract course details from homepage; pass an already fetched homepage soup to reuse it"""
+    if soup is None:
+        print(f"Scraping courses from homepage: {HOMEPAGE_URL}")
+        soup = _fetch_soup(HOMEPAGE_URL)
     
     text_content = soup.get_text()
     
     courses = []
     
     # Find all course sections (CSE103, CSE106, CSE110)
-    course_pattern = r'(CSE\d{3})(.*?)(?=CSE\d{3}|$)'
-    course_matches = re.finditer(course_pattern, text_content, re.DOTALL)
+    course_matches = _COURSE_SECTION_RE.finditer(text_content)
     
     for match in course_matches:
         course_code = match.group(1)
@@ -192,7 +223,7 @@ def scrape_courses_from_homepage():
         }
         
         # Extract credit hours
-        credit_match = re.search(r'Credit Hours\s+(\d+(?:\.\d+)?)\s+(\d+(?:\.\d+)?)\s+(\d+(?:\.\d+)?)', course_content)
+        credit_match = _CREDIT_HOURS_RE.search(course_content)
         if credit_match:
             course_data['credits'] = {
                 'theory': credit_match.group(1),
@@ -201,36 +232,35 @@ def scrape_courses_from_homepage():
             }
         
         # Extract prerequisite
-        prereq_match = re.search(r'Prerequisite:\s*([^\n]+)', course_content)
+        prereq_match = _PREREQ_RE.search(course_content)
         if prereq_match:
             course_data['prerequisite'] = clean_text(prereq_match.group(1))
         
         # Extract course objective
-        obj_match = re.search(r'Course Objective:\s*(.*?)(?=Course Outcomes|$)', course_content, re.DOTALL)
+        obj_match = _OBJECTIVE_RE.search(course_content)
         if obj_match:
             course_data['objective'] = clean_text(obj_match.group(1))
         
         # Extract course outcomes
-        outcome_pattern = r'(CO\d+)\s*\|\s*(.*?)(?=\||CO\d+|Course Contents|$)'
-        outcome_matches = re.finditer(outcome_pattern, course_content, re.DOTALL)
-        for outcome_match in outcome_matches:
-            course_data['outcomes'].append({
-                'code': outcome_match.group(1),
-                'description': clean_text(outcome_match.group(2))
-            })
+        course_data['outcomes'] = [
+            {'code': code, 'description': clean_text(description)}
+            for code, description in _OUTCOME_RE.findall(course_content)
+        ]
         
         # Extract course contents/topics
-        contents_section = re.search(r'Course Contents(.*?)(?=CSE\d{3}|$)', course_content, re.DOTALL)
+        contents_section = _CONTENTS_RE.search(course_content)
         if contents_section:
             content_lines = contents_section.group(1).split('\n')
             for line in content_lines:
                 line = clean_text(line)
-                if line and len(line) > 20 and not line.startswith('Course') and '|' in line:
-                    parts = line.split('|')
-                    if len(parts) >= 2:
+                if line and len(line) > 20 and not line.startswith('Course'):
+                    # Only the first two cells are kept; slice them out
+                    # instead of splitting the whole row
+                    pipe = line.find('|')
+                    if pipe >= 0:
                         course_data['contents'].append({
-                            'topic': clean_text(parts[0]),
-                            'co': clean_text(parts[1])
+                            'topic': clean_text(line[:pipe]),
+                            'co': clean_text(line[pipe + 1:].partition('|')[0])
                         })
         
         if course_data['objective'] or course_data['outcomes']:
@@ -239,6 +269,23 @@ def scrape_courses_from_homepage():
     return courses
 
 
+def save_json(data, filename):
+    """Write a dict as indented JSON, serializing one top-level key at a time"""
+    if orjson is None:
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.writelines(json.JSONEncoder(indent=2, ensure_ascii=False).iterencode(data))
+        return
+    with open(filename, 'wb') as f:
+        f.write(b'{')
+        for i, (key, value) in enumerate(data.items()):
+            f.write(b',\n  ' if i else b'\n  ')
+            f.write(orjson.dumps(key))
+            f.write(b': ')
+            # Nest the value's own indented lines one level under its key
+            f.write(orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).replace(b'\n', b'\n  '))
+        f.write(b'\n}' if data else b'}')
+
+
 def main():
     """Main scraping function"""
     print("="*70)
@@ -247,34 +294,34 @@ def main():
     
     all_data = {
         'scraped_at': datetime.now().isoformat(),
-        'source_urls': [
-            'https://fse.ewubd.edu/computer-science-engineering',
-            'https://fse.ewubd.edu/computer-science-engineering/chairperson-massage'
-        ],
+        'source_urls': [HOMEPAGE_URL, CHAIRPERSON_URL],
         'homepage': {},
         'chairperson': {},
         'courses': []
     }
     
     try:
-        # Scrape homepage
-        print("\n[1/3] Scraping homepage...")
-        all_data['homepage'] = scrape_homepage()
-        
-        # Scrape chairperson message
-        print("\n[2/3] Scraping chairperson message...")
-        all_data['chairperson'] = scrape_chairperson_message()
-        
-        # Scrape courses
-        print("\n[3/3] Scraping course details...")
-        all_data['courses'] = scrape_courses_from_homepage()
+        # The homepage feeds both the homepage and course sections, so it is
+        # fetched once; the chairperson page downloads alongside it
+        print("\nScraping homepage, chairperson message and course details...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {
+                executor.submit(_fetch_soup, HOMEPAGE_URL): 'homepage',
+                executor.submit(scrape_chairperson_message): 'chairperson',
+            }
+            for future in as_completed(futures):
+                if futures[future] == 'homepage':
+                    home_soup = future.result()
+                    all_data['homepage'] = scrape_homepage(home_soup)
+                    all_data['courses'] = scrape_courses_from_homepage(home_soup)
+                else:
+                    all_data['chairperson'] = future.result()
         
         # Save to JSON
         filename = 'ewu_cse_complete_data.json'
         print(f"\n{'='*70}")
         print(f"Saving to {filename}...")
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(all_data, f, indent=2, ensure_ascii=False)
+        save_json(all_data, filename)
         
         print(f"✓ Successfully saved!")
         print(f"{'='*70}")
@@ -5,11 +5,14 @@ Outputs: JSON, CSV, PDF, and Markdown formats for RAG systems
 """
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer, Tag
 import json
 import csv
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 import re
 from typing import Dict, List, Any
@@ -23,12 +26,103 @@ except ImportError:
     subprocess.check_call(['pip', 'install', 'fpdf2'])
     from fpdf import FPDF
 
+# Fast JSON serialization (optional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Profile extraction only inspects the page body; skip building <head> nodes
+PROFILE_STRAINER = SoupStrainer('body')
+
+# Container class patterns for the profile sections, checked in one tree walk
+PROFILE_SECTION_PATTERNS = (
+    ('research_interests', re.compile(r'research|interest')),
+    ('education', re.compile(r'education|qualification')),
+    ('publications', re.compile(r'publication')),
+)
+_PHONE_RE = re.compile(r'\d{3,}')
+
+# Columns written to the course CSV exports
+COURSE_CSV_FIELDS = ('course_code', 'prerequisite', 'objective')
+
+
+def clean_text(text: str) -> str:
+    """Clean and normalize text"""
+    if not text:
+        return ""
+    # str.split() drops leading/trailing whitespace and splits on any run of it
+    return ' '.join(text.split())
+
+
+@lru_cache(maxsize=256)
+def _pretty_title(key: str) -> str:
+    """Turn a data key like 'chairperson_name' into 'Chairperson Name'"""
+    return key.replace('_', ' ').title()
+
+
+def parse_faculty_profile(html: bytes) -> Dict:
+    """Extract profile details from a faculty page's raw HTML.
+
+    Kept at module level and free of scraper state so it can be shipped to
+    worker processes.
+    """
+    soup = BeautifulSoup(html, 'lxml', parse_only=PROFILE_STRAINER)
+    profile = {}
+    
+    # Single pass over the tree, keeping the first match of each kind in
+    # document order (same result as one soup.find() per field)
+    email = phone = None
+    sections = {}
+    for node in soup.descendants:
+        if isinstance(node, Tag):
+            if node.name == 'a':
+                if email is None and 'mailto:' in (node.get('href') or ''):
+                    email = node
+            elif node.name in ('div', 'section') and node.get('class'):
+                for key, pattern in PROFILE_SECTION_PATTERNS:
+                    if key not in sections and any(pattern.search(c) for c in node['class']):
+                        sections[key] = node
+        elif phone is None and isinstance(node, NavigableString) and _PHONE_RE.search(node):
+            phone = node
+        if email is not None and phone is not None and len(sections) == len(PROFILE_SECTION_PATTERNS):
+            break
+    
+    # Extract email
+    if email:
+        profile['email'] = email.get('href').replace('mailto:', '')
+    
+    # Extract phone
+    if phone:
+        profile['phone'] = clean_text(phone)
+    
+    # Extract research interests
+    if 'research_interests' in sections:
+        profile['research_interests'] = clean_text(sections['research_interests'].get_text())
+    
+    # Extract education
+    if 'education' in sections:
+        profile['education'] = clean_text(sections['education'].get_text())
+    
+    # Extract publications
+    if 'publications' in sections:
+        pub_list = []
+        for pub in sections['publications'].find_all(['li', 'p']):
+            pub_text = clean_text(pub.get_text())
+            if pub_text:
+                pub_list.append(pub_text)
+        profile['publications'] = pub_list
+    
+    return profile
+
 
 class EWUCSEScraper:
     """Complete scraper for EWU CSE Department website"""
     
     def __init__(self):
         self.base_url = "https://fse.ewubd.edu/computer-science-engineering"
+        # requests negotiates gzip/deflate, plus br when brotli is installed,
+        # and decodes the body transparently
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
@@ -46,15 +140,15 @@ class EWUCSEScraper:
             }
         }
     
-    def fetch_page(self, url: str, retries: int = 3) -> BeautifulSoup:
-        """Fetch and parse a webpage with retry logic"""
+    def fetch_html(self, url: str, retries: int = 3) -> bytes:
+        """Fetch a webpage's raw HTML with retry logic"""
         for attempt in range(retries):
             try:
                 print(f"Fetching: {url} (Attempt {attempt + 1}/{retries})")
                 response = self.session.get(url, timeout=30)
                 response.raise_for_status()
                 time.sleep(1)  # Be polite to the server
-                return BeautifulSoup(response.content, 'html.parser')
+                return response.content
             except Exception as e:
                 print(f"Error fetching {url}: {e}")
                 if attempt == retries - 1:
@@ -63,12 +157,16 @@ class EWUCSEScraper:
                 time.sleep(2)
         return None
     
+    def fetch_page(self, url: str, retries: int = 3) -> BeautifulSoup:
+        """Fetch and parse a webpage with retry logic"""
+        html = self.fetch_html(url, retries)
+        if not html:
+            return None
+        return BeautifulSoup(html, 'lxml')
+    
     def clean_text(self, text: str) -> str:
         """Clean and normalize text"""
-        if not text:
-            return ""
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        return clean_text(text)
     
     def scrape_department_info(self):
         """Scrape main department page information"""
@@ -110,6 +208,7 @@ class EWUCSEScraper:
         # Find all faculty member links or cards
         faculty_elements = soup.find_all(['a', 'div'], href=re.compile(r'faculty-view'))
         
+        faculty_list = []
         for element in faculty_elements:
             faculty = {}
             
@@ -130,53 +229,34 @@ class EWUCSEScraper:
             if element.name == 'a' and element.get('href'):
                 faculty['profile_url'] = f"https://fse.ewubd.edu{element['href']}"
             
-            # Try to get detailed info from profile page
+            faculty_list.append(faculty)
+        
+        # Fetch profile pages one at a time, then parse them across all cores
+        pending = []
+        for faculty in faculty_list:
             if faculty.get('profile_url'):
-                faculty.update(self.scrape_faculty_profile(faculty['profile_url']))
-            
-            if faculty.get('name'):
-                self.data['faculty_members'].append(faculty)
+                html = self.fetch_html(faculty['profile_url'])
+                if html:
+                    pending.append((faculty, html))
+                time.sleep(0.5)  # Be nice to the server
+        
+        if pending:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+                profiles = pool.map(parse_faculty_profile, [html for _, html in pending])
+                for (faculty, _), profile in zip(pending, profiles):
+                    faculty.update(profile)
+        
+        self.data['faculty_members'].extend(f for f in faculty_list if f.get('name'))
         
         print(f"Scraped {len(self.data['faculty_members'])} faculty members")
     
     def scrape_faculty_profile(self, url: str) -> Dict:
         """Scrape individual faculty profile"""
-        soup = self.fetch_page(url)
-        if not soup:
+        html = self.fetch_html(url)
+        if not html:
             return {}
         
-        profile = {}
-        
-        # Extract email
-        email = soup.find('a', href=re.compile(r'mailto:'))
-        if email:
-            profile['email'] = email.get('href').replace('mailto:', '')
-        
-        # Extract phone
-        phone = soup.find(text=re.compile(r'\d{3,}'))
-        if phone:
-            profile['phone'] = self.clean_text(phone)
-        
-        # Extract research interests
-        research = soup.find(['div', 'section'], class_=re.compile(r'research|interest'))
-        if research:
-            profile['research_interests'] = self.clean_text(research.get_text())
-        
-        # Extract education
-        education = soup.find(['div', 'section'], class_=re.compile(r'education|qualification'))
-        if education:
-            profile['education'] = self.clean_text(education.get_text())
-        
-        # Extract publications
-        publications = soup.find(['div', 'section'], class_=re.compile(r'publication'))
-        if publications:
-            pub_list = []
-            for pub in publications.find_all(['li', 'p']):
-                pub_text = self.clean_text(pub.get_text())
-                if pub_text:
-                    pub_list.append(pub_text)
-            profile['publications'] = pub_list
-        
+        profile = parse_faculty_profile(html)
         time.sleep(0.5)  # Be nice to the server
         return profile
     
@@ -328,12 +408,18 @@ class EWUCSEScraper:
         # Find lab sections
         lab_sections = soup.find_all(['div', 'section'], class_=re.compile(r'lab|facility'))
         
+        # Nested lab/facility containers share headings; skip ones already covered
+        covered_headings = set()
+        
         for lab in lab_sections:
             lab_data = {}
             
             # Extract lab name
             name = lab.find(['h2', 'h3', 'h4'])
             if name:
+                if id(name) in covered_headings:
+                    continue
+                covered_headings.add(id(name))
                 lab_data['name'] = self.clean_text(name.get_text())
             
             # Extract description
@@ -413,8 +499,12 @@ class EWUCSEScraper:
     def export_json(self, filename: str = 'ewu_cse_data.json'):
         """Export data to JSON"""
         print(f"\nExporting to JSON: {filename}")
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(self.data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f, indent=2, ensure_ascii=False)
         print(f"✓ JSON export completed: {filename}")
     
     def export_csv(self, base_filename: str = 'ewu_cse'):
@@ -428,30 +518,31 @@ class EWUCSEScraper:
                 writer = csv.DictWriter(f, fieldnames=['name', 'designation', 'email', 'phone', 
                                                        'research_interests', 'education', 'profile_url'])
                 writer.writeheader()
-                for faculty in self.data['faculty_members']:
-                    writer.writerow(faculty)
+                writer.writerows(self.data['faculty_members'])
             print(f"✓ Faculty CSV: {filename}")
         
         # Export core courses
         if self.data['courses']['core_courses']:
             filename = f'{base_filename}_core_courses.csv'
             with open(filename, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=['course_code', 'prerequisite', 'objective'])
+                writer = csv.DictWriter(f, fieldnames=COURSE_CSV_FIELDS)
                 writer.writeheader()
-                for course in self.data['courses']['core_courses']:
-                    row = {k: str(v) for k, v in course.items() if k in ['course_code', 'prerequisite', 'objective']}
-                    writer.writerow(row)
+                writer.writerows(
+                    {k: str(course[k]) for k in COURSE_CSV_FIELDS if k in course}
+                    for course in self.data['courses']['core_courses']
+                )
             print(f"✓ Core Courses CSV: {filename}")
         
         # Export elective courses
         if self.data['courses']['elective_courses']:
             filename = f'{base_filename}_elective_courses.csv'
             with open(filename, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=['course_code', 'prerequisite', 'objective'])
+                writer = csv.DictWriter(f, fieldnames=COURSE_CSV_FIELDS)
                 writer.writeheader()
-                for course in self.data['courses']['elective_courses']:
-                    row = {k: str(v) for k, v in course.items() if k in ['course_code', 'prerequisite', 'objective']}
-                    writer.writerow(row)
+                writer.writerows(
+                    {k: str(course[k]) for k in COURSE_CSV_FIELDS if k in course}
+                    for course in self.data['courses']['elective_courses']
+                )
             print(f"✓ Elective Courses CSV: {filename}")
     
     def export_markdown(self, filename: str = 'ewu_cse_data.md'):
@@ -467,7 +558,7 @@ class EWUCSEScraper:
             if self.data['department_info']:
                 f.write("## Department Information\n\n")
                 for key, value in self.data['department_info'].items():
-                    f.write(f"**{key.replace('_', ' ').title()}:** {value}\n\n")
+                    f.write(f"**{_pretty_title(key)}:** {value}\n\n")
             
             # Faculty Members
             if self.data['faculty_members']:
@@ -574,7 +665,7 @@ class EWUCSEScraper:
             pdf.cell(0, 10, 'Department Information', 0, 1)
             pdf.set_font('Arial', '', 10)
             for key, value in self.data['department_info'].items():
-                pdf.multi_cell(0, 6, f"{key.replace('_', ' ').title()}: {str(value)[:500]}")
+                pdf.multi_cell(0, 6, f"{_pretty_title(key)}: {str(value)[:500]}")
                 pdf.ln(2)
         
         # Faculty Members Summary
@@ -619,10 +710,17 @@ def main():
     print("Exporting Data to Multiple Formats")
     print("="*60)
     
-    scraper.export_json('ewu_cse_complete_data.json')
-    scraper.export_csv('ewu_cse')
-    scraper.export_markdown('ewu_cse_rag_ready.md')
-    scraper.export_pdf('ewu_cse_report.pdf')
+    # Each exporter writes its own file(s) and only reads scraper.data,
+    # so they can overlap disk I/O with the CPU-bound PDF rendering
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [
+            pool.submit(scraper.export_json, 'ewu_cse_complete_data.json'),
+            pool.submit(scraper.export_csv, 'ewu_cse'),
+            pool.submit(scraper.export_markdown, 'ewu_cse_rag_ready.md'),
+            pool.submit(scraper.export_pdf, 'ewu_cse_report.pdf'),
+        ]
+        for future in futures:
+            future.result()
     
     # Summary
     print("\n" + "="*60)
@@ -4,35 +4,286 @@ Output: JSON file only
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+import lxml.etree
+import lxml.html
+import hashlib
 import json
+import os
 import re
-from datetime import datetime
-from typing import Dict, Any, List
-
-
+import tempfile
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+# Fast JSON serialization (optional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+UNDERGRADUATE_URL = "https://fse.ewubd.edu/computer-science-engineering/undergraduate-programs"
+GRADUATE_URL = "https://fse.ewubd.edu/computer-science-engineering/graduate-programs"
+
+# Both program pages live on the same host; one pooled session keeps
+# connections alive between them and across the concurrent fetches
+_SESSION = requests.Session()
+_SESSION.headers['User-Agent'] = 'Mozilla/5.0'
+_SESSION.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=4))
+
+# Validators and body of the last full response per page, so repeat runs
+# can revalidate with a conditional GET and skip the download on 304;
+# kept beside the script whatever the working directory
+_HTTP_CACHE_DIR = Path(__file__).resolve().parent / '.http_cache'
+
+# Page regions holding the program text; navigation, header and footer
+# text outside them is never fed to the regexes. The first match in
+# document order wins
+_CONTENT_XPATH = (
+    "(//div[contains(concat(' ', normalize-space(@class), ' '), ' page-content ')]"
+    " | //main | //article"
+    " | //div[contains(concat(' ', normalize-space(@class), ' '), ' content ')]"
+    " | //*[@id='content'])[1]"
+)
+
+# The department pages are served as UTF-8; libxml2 would otherwise fall
+# back to Latin-1 when the markup carries no charset declaration
+_HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8', collect_ids=False)
+
+# Patterns are compiled once at import time instead of on every call
+# Undergraduate program page
+_VISION_RE = re.compile(r'Vision Statement of CSE Department:\s*(.*?)(?=Mission of CSE|$)', re.DOTALL)
+_MISSION_SECTION_RE = re.compile(r'Mission of CSE Department:(.*?)(?=Program Educational Objectives|$)', re.DOTALL)
+_MISSION_POINT_RE = re.compile(r'-\s*(To .*?)(?=-\s*To|Program|$)', re.DOTALL)
+_PEO_DESC_RE = re.compile(r'Program Educational Objectives \(PEOs\) of B\. Sc\. in CSE Program:\s*(.*?)(?=PEO1|$)', re.DOTALL)
+
+# PEO/PO/K/EP/EA table rows and PO-to-PEO mapping rows share one scan; each
+# alternative is an outer named group so match.lastgroup names the kind that
+# matched. Cell text is [^|]*? rather than .*? so a failed row can never
+# backtrack across pipes. Mapping rows also start with 'POn:', so their
+# three-cell, single-line form is tried before the PO alternative
+_OUTCOME_TABLES_RE = re.compile(
+    r'(?P<map>(?P<map_name>(?P<map_code>PO\d+):[^|\n]+)\|(?P<map_peo1>[^|\n]*)\|(?P<map_peo2>[^|\n]*)\|(?P<map_peo3>[^\n]*))'
+    r'|(?P<peo>(?P<peo_code>PEO\d+)\s*\|\s*(?P<peo_text>[^|]*?)(?=\s*\||PEO\d+|Program Outcomes|$))'
+    r'|(?P<po>(?P<po_code>PO\d+):\s*(?P<po_title>[^|]+?)\s*\|\s*(?P<po_text>[^|]*?)(?=\s*\||PO\d+:|Mapping of Program|$))'
+    r'|(?P<k>(?P<k_code>K\d+):\s*(?P<k_title>[^|]+?)\s*\|\s*(?P<k_text>[^|]*?)(?=\s*\||K\d+:|Range of Complex|$))'
+    r'|(?P<ep>(?P<ep_code>EP\s*\d+):\s*(?P<ep_title>[^|]+?)\s*\|\s*(?P<ep_text>[^|]*?)(?=\s*\||EP\s*\d+:|Range of Complex Activities|$))'
+    r'|(?P<ea>(?P<ea_code>EA\d+):\s*(?P<ea_title>[^|]+?)\s*\|\s*(?P<ea_text>[^|]*?)(?=\s*\||EA\d+:|Course Summary|$))'
+)
+# Output key and field names for the titled outcome tables
+_OUTCOME_TABLE_FIELDS = {
+    'po': ('po', 'title', 'description'),
+    'k': ('knowledge_profile', 'title', 'description'),
+    'ep': ('complex_problem_solving', 'attribute', 'characteristics'),
+    'ea': ('complex_activities', 'attribute', 'characteristics'),
+}
+
+_PO_DESC_RE = re.compile(r'Program Outcomes \(POs\) of B\. Sc\. in CSE Program\s*(.*?)(?=PO\s*\||$)', re.DOTALL)
+_KP_DESC_RE = re.compile(r'Knowledge Profile\s*(.*?)(?=Knowledge Profile\s*\||$)', re.DOTALL)
+_CPS_DESC_RE = re.compile(r'Range of Complex Engineering Problem Solving\s*(.*?)(?=Attribute\s*\||$)', re.DOTALL)
+_CA_DESC_RE = re.compile(r'Range of Complex Engineering Activities\s*(.*?)(?=Attribute\s*\||$)', re.DOTALL)
+# One row shape serves every course table; callers filter by code prefix.
+# A match never leaves its line, so a code in prose cannot swallow the next
+# row as its name, nor a row whose last cell is empty the next row as its
+# prerequisite; the whole-page scan relies on this to keep rows in the
+# section they are printed in
+_COURSE_ROW_RE = re.compile(r'([A-Z]{3}\d+)[ \t]+([^|\n]+?)[ \t]*\|[ \t]*([\d.+]+)[ \t]*\|[ \t]*([^\n]*)')
+_SUMMARY_RE = re.compile(r'([A-Za-z\s&]+?Courses)\s*\|\s*(\d+)')
+_TOTAL_RE = re.compile(r'Total\s*\|\s*(\d+)')
+_CORE_SECTION_RE = re.compile(r'Core Computer Science and Engineering Courses.*?(48\+14=62)(.*?)(?=Core Capstone|$)', re.DOTALL)
+_CAPSTONE_RE = re.compile(r'(CSE400)[ \t]+Capstone Project[ \t]*\|[ \t]*([\d.+]+)[ \t]*\|[ \t]*([^\n]*)')
+_MAJOR_AREAS = [
+    ('1. Intelligent Systems and Data Science', 'Intelligent Systems and Data Science'),
+    ('2. Software Engineering', 'Software Engineering'),
+    ('3. Communications and Networking', 'Communications and Networking'),
+    ('4. Hardware Engineering', 'Hardware Engineering')
+]
+_MAJOR_RES = [
+    (heading, name, re.compile(rf'{re.escape(heading)}(.*?)(?=\d+\.\s+\w+|Non-Major Area|Note:|$)', re.DOTALL))
+    for heading, name in _MAJOR_AREAS
+]
+_MAJOR_COMPULSORY_RE = re.compile(r'Compulsory Courses.*?(6\+2=8)(.*?)Elective Courses', re.DOTALL)
+_MAJOR_ELECTIVE_RE = re.compile(r'Elective Courses.*?(9\+3=12)(.*?)(?=\d+\.\s+|Non-Major|$)', re.DOTALL)
+_NONMAJOR_SECTION_RE = re.compile(r'Non-Major Area: Computational Theory(.*?)(?=Note:|Course Flowchart|$)', re.DOTALL)
+_NOTE_RE = re.compile(r'Note:\s*([^\n]+)')
+_FLOWCHART_RE = re.compile(r'Course Flowchart(.*?)$', re.DOTALL)
+_FIRST_SEMESTER_RE = re.compile(r'1st Semester(.*?)2nd Semester', re.DOTALL)
+_FLOWCHART_COURSE_RE = re.compile(r'([A-Z]{3}\d+)[^(]*\(([^)]+)\)')
+_YEAR_CREDIT_RE = re.compile(r'Year-Credit\s*\|\s*(\d+)')
+
+# Graduate program page
+_MAJOR_AREAS_DESC_RE = re.compile(r'Major Areas:\s*(.*?)(?=A student will|$)', re.DOTALL)
+_AREA_NAME_RE = re.compile(r'(?:-|\u2022)?\s*([A-Za-z][A-Za-z\s&\-]{4,}?(?:Systems|Engineering|Science|Networking|Software|Hardware))')
+_AREA_SPLIT_RE = re.compile(r',|\n')
+_MAJOR_CHANGE_POLICY_RE = re.compile(r'(A student will have to declare.*?major area.*?before.*?)', re.DOTALL | re.IGNORECASE)
+_ADMISSION_SECTION_RE = re.compile(r'Admission Requirements:(.*?)(?=Study Track:|Study Tracks:|Length of the Program:|$)', re.DOTALL | re.IGNORECASE)
+_DISCIPLINE_RE = re.compile(r'-\s*([A-Za-z0-9 ,&\-()]+(?:Engineering|Computer|Science|Technology)[A-Za-z0-9 ,&\-()]*)')
+_BULLET_RE = re.compile(r'-\s*([A-Za-z].+)')
+_ADMISSION_CGPA_RE = re.compile(r'(minimum\s+CGPA(?:\s+of)?\s+[\d.]+)', re.IGNORECASE)
+_HSC_RE = re.compile(r'([^.]*HSC[^.]*\.)')
+_ADMISSION_TEST_RE = re.compile(r'([^.]*admission test[^.]*\.)', re.IGNORECASE)
+_REQUIREMENT_SENTENCE_RE = re.compile(r'(?:Candidates|Applicants)\s+must[^.]*\.')
+_TRACK_SECTION_RE = re.compile(r'Study Track:(.*?)(?=Length of the Program:|Program Length:|Degree Requirement:|$)', re.DOTALL | re.IGNORECASE)
+_TRACK_CHANGE_POLICY_RE = re.compile(r'(A student will have to declare.*?study track.*?)', re.DOTALL | re.IGNORECASE)
+_LENGTH_SECTION_RE = re.compile(r'Length of the Program:\s*(.*?)(?=MS in CSE Program Cost:|MS in CSE Program Cost|Degree Requirement:|$)', re.DOTALL | re.IGNORECASE)
+_MIN_LENGTH_RE = re.compile(r'minimum\s*of\s*(\d+\s*(?:semester|semesters|year|years)?)', re.IGNORECASE)
+_MAX_LENGTH_RE = re.compile(r'up to\s*(\d+\s*(?:semester|semesters|year|years)?)', re.IGNORECASE)
+_COST_SECTION_RE = re.compile(r'MS in CSE Program Cost:.*?(Grand Total.*?)(?=Degree Requirement:|Degree Requirements:|$)', re.DOTALL | re.IGNORECASE)
+_AMOUNT_RE = re.compile(r'([\d,]+(?:\.\d+)?)')
+# The track headings are matched case-sensitively here, as in the track
+# slices and study-track checks, so all of them agree on the boundaries
+_DEGREE_REQ_SECTION_RE = re.compile(r'Degree Requirement:(.*?)(?=(?-i:Thesis Track|Project Track)|$)', re.DOTALL | re.IGNORECASE)
+_MIN_CREDITS_RE = re.compile(r'(\d+\s+credits)', re.IGNORECASE)
+_DEGREE_CGPA_RE = re.compile(r'(\d+\.\d+\s+on a\s+4\.0)', re.IGNORECASE)
+_GRAD_COURSE_RE = re.compile(r'([A-Z]{3}\d+)\s+([^|]+?)\s*\|\s*([\d.]+)')
+_THESIS_CREDIT_RE = re.compile(r'(\d+\s*credits)\s*for\s*thesis', re.IGNORECASE)
+_COMPULSORY_ALL_MAJORS_RE = re.compile(r'Compulsory Courses for all majors(.*?)(?=Major specific|Major Specific Courses|$)', re.DOTALL | re.IGNORECASE)
+_GROUP_PREREQ_RE = re.compile(r'Prerequisite[s]?:\s*([A-Za-z0-9, ]+)', re.IGNORECASE)
+_MAJOR_SPECIFIC_RE = re.compile(r'Major Specific Courses:(.*?)(?=Thesis|Project|$)', re.DOTALL | re.IGNORECASE)
+# A run of lines up to the next line that is a major heading on its own
+_MAJOR_BLOCK_RE = re.compile(r'[^\n]+(?:\n(?!(?:[A-Za-z &]+ Major(?: Area)?|Major Area: [A-Za-z &]+)$)[^\n]*)*', re.MULTILINE)
+_MAJOR_TITLE_RE = re.compile(r'([A-Za-z &]+ Major(?: Area)?|Major Area: [A-Za-z &]+)')
+_THESIS_PROJECT_RE = re.compile(r'(Thesis and Project|Thesis Project|Thesis/Project)(.*?)(?=Admission|Degree|$)', re.DOTALL | re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
 def clean_text(text: str) -> str:
     """Clean text by removing extra whitespace"""
     if not text:
         return ""
-    return re.sub(r'\s+', ' ', text).strip()
+    # str.split() drops leading/trailing whitespace and splits on any run of it
+    return ' '.join(text.split())
+
+
+def _page_text(content: bytes) -> str:
+    """Text of the main content container of a department page, or of the whole document"""
+    root = lxml.html.document_fromstring(content, parser=_HTML_PARSER)
+    lxml.etree.strip_elements(root, 'script', 'style', with_tail=False)
+    container = root.xpath(_CONTENT_XPATH)
+    container = container[0] if container else root
+    # Collapse each table row into one 'cell | cell | cell' line, the row
+    # shape every table pattern reads, instead of one line per cell
+    for row in list(container.iter('tr')):
+        cells = [clean_text(''.join(cell.itertext())) for cell in row if cell.tag in ('td', 'th')]
+        tail = row.tail
+        row.clear()
+        row.text = ' | '.join(cells)
+        row.tail = tail
+    strings = (text.strip() for text in container.itertext())
+    return '\n'.join(text for text in strings if text)
+
+
+def _section_span(text: str, start: str, *ends: str, require_end: bool = False) -> Optional[Tuple[int, int]]:
+    """Offsets after a literal start heading up to the nearest end heading (or the end of the text unless require_end), or None"""
+    i = text.find(start)
+    if i < 0:
+        return None
+    i += len(start)
+    found = [j for j in (text.find(end, i) for end in ends) if j >= 0]
+    if found:
+        return (i, min(found))
+    return None if require_end else (i, len(text))
+
+
+def _scan_course_rows(text: str) -> Tuple[List[int], List[tuple]]:
+    """Start offsets and (code, name, credits, prerequisite) groups of every course row in the text"""
+    starts, rows = [], []
+    # Bound methods as locals keep the per-row work to fast local loads
+    add_start, add_row = starts.append, rows.append
+    for match in _COURSE_ROW_RE.finditer(text):
+        add_start(match.start())
+        add_row(match.groups())
+    return starts, rows
+
+
+def _course_rows(scan: Tuple[List[int], List[tuple]], span: Tuple[int, int], prefixes) -> List[tuple]:
+    """Scanned rows starting inside span whose code starts with one of the prefixes"""
+    starts, rows = scan
+    lo, hi = bisect_left(starts, span[0]), bisect_left(starts, span[1])
+    return [row for row in rows[lo:hi] if row[0][:3] in prefixes]
+
+
+def _credits(text: str):
+    """Whole-number credits as an int; lab or fractional credits like '3+1' stay as written"""
+    return int(text) if text.isdigit() else text
+
+
+def _prereq(text: str):
+    """Cleaned prerequisite cell, or None when it is empty or 'None'"""
+    cleaned = clean_text(text)
+    return cleaned if cleaned and cleaned != 'None' else None
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write data to path via a temporary sibling file, so readers never see a partial file"""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _fetch(url: str) -> bytes:
+    """Raw body of a department page, reusing the cached copy when the server reports it unchanged"""
+    key = hashlib.sha1(url.encode()).hexdigest()
+    meta_path = _HTTP_CACHE_DIR / f'{key}.json'
+    body_path = _HTTP_CACHE_DIR / f'{key}.html'
+
+    headers = {}
+    if body_path.exists():
+        # A missing or unreadable metadata file is just a cache miss
+        try:
+            validators = json.loads(meta_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            validators = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+
+    response = _SESSION.get(url, headers=headers, timeout=30)
+    if response.status_code == 304 and headers:
+        try:
+            return body_path.read_bytes()
+        except OSError:
+            # The cached body vanished since the check; fetch it in full
+            response = _SESSION.get(url, timeout=30)
+    response.raise_for_status()
+
+    # Only pages the server can revalidate are worth keeping. The body is
+    # written before its validators, each atomically, so a crash or a
+    # concurrent run never leaves metadata pointing at a truncated page
+    validators = {'etag': response.headers.get('ETag'), 'last_modified': response.headers.get('Last-Modified')}
+    if any(validators.values()):
+        _HTTP_CACHE_DIR.mkdir(exist_ok=True)
+        _write_atomic(body_path, response.content)
+        _write_atomic(meta_path, json.dumps(validators).encode('utf-8'))
+    return response.content
 
 
 def scrape_undergraduate_programs() -> Dict[str, Any]:
     """Scrape COMPLETE undergraduate program details - EVERY WORD"""
-    url = "https://fse.ewubd.edu/computer-science-engineering/undergraduate-programs"
+    print(f"Scraping undergraduate programs: {UNDERGRADUATE_URL}")
+    return _parse_undergraduate(_fetch(UNDERGRADUATE_URL))
 
-    headers = {'User-Agent': 'Mozilla/5.0'}
-    print(f"Scraping undergraduate programs: {url}")
 
-    response = requests.get(url, headers=headers, timeout=30)
-    response.raise_for_status()
-    soup = BeautifulSoup(response.content, 'html.parser')
-
-    text_content = soup.get_text()
+def _parse_undergraduate(html: bytes) -> Dict[str, Any]:
+    """Extract the undergraduate program details from the fetched page"""
+    # Every pattern below would come back empty on a moved or redesigned
+    # page; a byte search for its anchor heading catches that before parsing
+    if b'Program Educational Objectives' not in html:
+        raise RuntimeError(f"No 'Program Educational Objectives' section on {UNDERGRADUATE_URL}; the page layout has changed")
+    text_content = _page_text(html)
 
     data = {
-        'url': url,
+        'url': UNDERGRADUATE_URL,
         'program_name': 'B. Sc. in Computer Science and Engineering',
         'vision_statement': '',
         'mission_statement': [],
@@ -101,111 +352,67 @@ def scrape_undergraduate_programs() -> Dict[str, Any]:
     }
 
     # Extract Vision
-    vision_match = re.search(r'Vision Statement of CSE Department:\s*(.*?)(?=Mission of CSE|$)', text_content, re.DOTALL)
+    vision_match = _VISION_RE.search(text_content)
     if vision_match:
         data['vision_statement'] = clean_text(vision_match.group(1))
 
     # Extract Mission (all points)
-    mission_section = re.search(r'Mission of CSE Department:(.*?)(?=Program Educational Objectives|$)', text_content, re.DOTALL)
+    mission_section = _MISSION_SECTION_RE.search(text_content)
     if mission_section:
-        mission_points = re.findall(r'-\s*(To .*?)(?=-\s*To|Program|$)', mission_section.group(1), re.DOTALL)
+        mission_points = _MISSION_POINT_RE.findall(mission_section.group(1))
         data['mission_statement'] = [clean_text(m) for m in mission_points]
 
     # Extract PEO description
-    peo_desc = re.search(r'Program Educational Objectives \(PEOs\) of B\. Sc\. in CSE Program:\s*(.*?)(?=PEO1|$)', text_content, re.DOTALL)
+    peo_desc = _PEO_DESC_RE.search(text_content)
     if peo_desc:
         data['peo_description'] = clean_text(peo_desc.group(1))
 
-    # Extract PEO (all 3)
-    peo_pattern = r'(PEO\d+)\s*\|\s*(.*?)(?=\s*\||PEO\d+|Program Outcomes|$)'
-    peo_matches = re.finditer(peo_pattern, text_content, re.DOTALL)
-    for match in peo_matches:
-        data['peo'][match.group(1)] = clean_text(match.group(2))
-
     # Extract PO description
-    po_desc = re.search(r'Program Outcomes \(POs\) of B\. Sc\. in CSE Program\s*(.*?)(?=PO\s*\||$)', text_content, re.DOTALL)
+    po_desc = _PO_DESC_RE.search(text_content)
     if po_desc:
         data['po_description'] = clean_text(po_desc.group(1))
 
-    # Extract PO (all 12 with full descriptions)
-    po_pattern = r'(PO\d+):\s*([^|]+?)\s*\|\s*(.*?)(?=\s*\||PO\d+:|Mapping of Program|$)'
-    po_matches = re.finditer(po_pattern, text_content, re.DOTALL)
-    for match in po_matches:
-        po_code = match.group(1)
-        po_title = clean_text(match.group(2))
-        po_desc = clean_text(match.group(3))
-        data['po'][po_code] = {
-            'title': po_title,
-            'description': po_desc
-        }
-
-    # Extract PO to PEO Mapping (complete table)
-    mapping_lines = re.findall(r'(PO\d+:[^|]+)\s*\|\s*([^|]*)\s*\|\s*([^|]*)\s*\|\s*([^\n]*)', text_content)
-    for po_line, peo1, peo2, peo3 in mapping_lines:
-        po_key = re.search(r'PO\d+', po_line)
-        if po_key:
-            data['po_to_peo_mapping'][po_key.group(0)] = {
-                'po_name': clean_text(po_line),
-                'PEO1': 'X' in peo1,
-                'PEO2': 'X' in peo2,
-                'PEO3': 'X' in peo3
-            }
-
     # Knowledge Profile description
-    kp_desc = re.search(r'Knowledge Profile\s*(.*?)(?=Knowledge Profile\s*\||$)', text_content, re.DOTALL)
+    kp_desc = _KP_DESC_RE.search(text_content)
     if kp_desc:
         desc_text = kp_desc.group(1)
         if 'The B. Sc. in CSE curriculum' in desc_text:
             data['knowledge_profile_description'] = clean_text(desc_text)
 
-    # Extract Knowledge Profile (K1-K8)
-    knowledge_pattern = r'(K\d+):\s*([^|]+?)\s*\|\s*(.*?)(?=\s*\||K\d+:|Range of Complex|$)'
-    knowledge_matches = re.finditer(knowledge_pattern, text_content, re.DOTALL)
-    for match in knowledge_matches:
-        k_code = match.group(1)
-        k_title = clean_text(match.group(2))
-        k_desc = clean_text(match.group(3))
-        data['knowledge_profile'][k_code] = {
-            'title': k_title,
-            'description': k_desc
-        }
-
     # Complex Problem Solving description
-    cps_desc = re.search(r'Range of Complex Engineering Problem Solving\s*(.*?)(?=Attribute\s*\||$)', text_content, re.DOTALL)
+    cps_desc = _CPS_DESC_RE.search(text_content)
     if cps_desc:
         data['complex_problem_solving_description'] = clean_text(cps_desc.group(1))
 
-    # Extract Complex Engineering Problem Solving (EP1-EP7)
-    ep_pattern = r'(EP\s*\d+):\s*([^|]+?)\s*\|\s*(.*?)(?=\s*\||EP\s*\d+:|Range of Complex Activities|$)'
-    ep_matches = re.finditer(ep_pattern, text_content, re.DOTALL)
-    for match in ep_matches:
-        ep_code = match.group(1).replace(' ', '')
-        ep_title = clean_text(match.group(2))
-        ep_desc = clean_text(match.group(3))
-        data['complex_problem_solving'][ep_code] = {
-            'attribute': ep_title,
-            'characteristics': ep_desc
-        }
-
     # Complex Activities description
-    ca_desc = re.search(r'Range of Complex Engineering Activities\s*(.*?)(?=Attribute\s*\||$)', text_content, re.DOTALL)
+    ca_desc = _CA_DESC_RE.search(text_content)
     if ca_desc:
         data['complex_activities_description'] = clean_text(ca_desc.group(1))
 
-    # Extract Complex Engineering Activities (EA1-EA5)
-    ea_pattern = r'(EA\d+):\s*([^|]+?)\s*\|\s*(.*?)(?=\s*\||EA\d+:|Course Summary|$)'
-    ea_matches = re.finditer(ea_pattern, text_content, re.DOTALL)
-    for match in ea_matches:
-        ea_code = match.group(1)
-        ea_title = clean_text(match.group(2))
-        ea_desc = clean_text(match.group(3))
-        data['complex_activities'][ea_code] = {
-            'attribute': ea_title,
-            'characteristics': ea_desc
-        }
+    # Extract PEO (all 3), PO (all 12), PO to PEO Mapping, Knowledge Profile
+    # (K1-K8), Complex Engineering Problem Solving (EP1-EP7) and Activities
+    # (EA1-EA5) in a single scan, dispatching on the alternative that matched
+    for match in _OUTCOME_TABLES_RE.finditer(text_content):
+        kind = match.lastgroup
+        code = match.group(f'{kind}_code').replace(' ', '')
+        if kind == 'map':
+            data['po_to_peo_mapping'][code] = {
+                'po_name': clean_text(match.group('map_name')),
+                'PEO1': match.group('map_peo1').strip() == 'X',
+                'PEO2': match.group('map_peo2').strip() == 'X',
+                'PEO3': match.group('map_peo3').strip() == 'X'
+            }
+        elif kind == 'peo':
+            data['peo'][code] = clean_text(match.group('peo_text'))
+        else:
+            key, title_field, text_field = _OUTCOME_TABLE_FIELDS[kind]
+            data[key][code] = {
+                title_field: clean_text(match.group(f'{kind}_title')),
+                text_field: clean_text(match.group(f'{kind}_text'))
+            }
 
     # Extract Course Summary (complete table)
-    summary_lines = re.findall(r'([A-Za-z\s&]+?Courses)\s*\|\s*(\d+)', text_content)
+    summary_lines = _SUMMARY_RE.findall(text_content)
     for category, credits in summary_lines:
         cat_clean = clean_text(category)
         if cat_clean and len(cat_clean) > 10:
@@ -215,115 +422,144 @@ def scrape_undergraduate_programs() -> Dict[str, Any]:
                 data['course_summary'][cat_clean] = credits
 
     # Extract Total credits
-    total_match = re.search(r'Total\s*\|\s*(\d+)', text_content)
+    total_match = _TOTAL_RE.search(text_content)
     if total_match:
         try:
             data['course_summary_total'] = int(total_match.group(1))
         except ValueError:
             data['course_summary_total'] = total_match.group(1)
 
+    # Every course table shares one row shape; scan the page for rows once
+    # and let each section below pick its rows by offset
+    course_scan = _scan_course_rows(text_content)
+    whole_page = (0, len(text_content))
+
     # Extract Compulsory Language and General Education Courses
-    lang_courses = re.findall(r'(ENG\d+|GEN\d+)\s+([^|]+?)\s*\|\s*(\d+)\s*\|\s*([^\n]*?)(?=\n|ENG|GEN|Elective)', text_content)
-    for code, name, credits, prereq in lang_courses:
-        # best-effort check: include all language courses found
-        data['course_lists']['compulsory_language_general_education']['courses'].append({
+    # best-effort check: include all language courses found
+    data['course_lists']['compulsory_language_general_education']['courses'] = [
+        {
             'code': code,
             'name': clean_text(name),
-            'credits': int(credits),
-            'prerequisite': clean_text(prereq) if clean_text(prereq) and clean_text(prereq) != 'None' else None
-        })
+            'credits': _credits(credits),
+            'prerequisite': _prereq(prereq)
+        }
+        for code, name, credits, prereq in _course_rows(course_scan, whole_page, {'ENG', 'GEN'})
+    ]
 
     # Extract Elective General Education - Social Science
-    social_science_section = re.search(r'Social Science Courses \(any one course\)(.*?)Arts and Humanities', text_content, re.DOTALL)
-    if social_science_section:
-        courses = re.findall(r'(ECO\d+|GEN\d+|SOC\d+)\s+([^|]+?)\s*\|\s*(\d+)\s*\|\s*([^\n]*)', social_science_section.group(1))
-        for code, name, credits, prereq in courses:
-            data['course_lists']['elective_general_education']['categories']['social_science'].append({
+    social_science_section = _section_span(text_content, 'Social Science Courses (any one course)', 'Arts and Humanities')
+    if social_science_section is not None:
+        data['course_lists']['elective_general_education']['categories']['social_science'] = [
+            {
                 'code': code,
                 'name': clean_text(name),
-                'credits': int(credits),
-                'prerequisite': clean_text(prereq) if clean_text(prereq) and clean_text(prereq) != 'None' else None
-            })
+                'credits': _credits(credits),
+                'prerequisite': _prereq(prereq)
+            }
+            for code, name, credits, prereq in _course_rows(course_scan, social_science_section, {'ECO', 'GEN', 'SOC'})
+        ]
 
     # Extract Elective General Education - Arts and Humanities
-    arts_section = re.search(r'Arts and Humanities Courses \(any one course\)(.*?)Business Courses', text_content, re.DOTALL)
-    if arts_section:
-        courses = re.findall(r'(GEN\d+|SOC\d+)\s+([^|]+?)\s*\|\s*(\d+)\s*\|\s*([^\n]*)', arts_section.group(1))
-        for code, name, credits, prereq in courses:
-            data['course_lists']['elective_general_education']['categories']['arts_humanities'].append({
+    arts_section = _section_span(text_content, 'Arts and Humanities Courses (any one course)', 'Business Courses')
+    if arts_section is not None:
+        data['course_lists']['elective_general_education']['categories']['arts_humanities'] = [
+            {
                 'code': code,
                 'name': clean_text(name),
-                'credits': int(credits),
-                'prerequisite': clean_text(prereq) if clean_text(prereq) and clean_text(prereq) != 'None' else None
-            })
+                'credits': _credits(credits),
+                'prerequisite': _prereq(prereq)
+            }
+            for code, name, credits, prereq in _course_rows(course_scan, arts_section, {'GEN', 'SOC'})
+        ]
 
     # Extract Elective General Education - Business
-    business_section = re.search(r'Business Courses \(any one course\)(.*?)(?=Compulsory Natural Science|$)', text_content, re.DOTALL)
-    if business_section:
-        courses = re.findall(r'(ACT\d+|BUS\d+|MGT\d+|FIN\d+|MKT\d+)\s+([^|]+?)\s*\|\s*(\d+)\s*\|\s*([^\n]*)', business_section.group(1))
-        for code, name, credits, prereq in courses:
-            data['course_lists']['elective_general_education']['categories']['business'].append({
+    business_section = _section_span(text_content, 'Business Courses (any one course)', 'Compulsory Natural Science')
+    if business_section is not None:
+        data['course_lists']['elective_general_education']['categories']['business'] = [
+            {
                 'code': code,
                 'name': clean_text(name),
-                'credits': int(credits),
-                'prerequisite': clean_text(prereq) if clean_text(prereq) and clean_text(prereq) != 'None' else None
-            })
+                'credits': _credits(credits),
+                'prerequisite': _prereq(prereq)
+            }
+            for code, name, credits, prereq in _course_rows(course_scan, business_section, {'ACT', 'BUS', 'MGT', 'FIN', 'MKT'})
+        ]
 
     # Extract Compulsory Natural Science Courses
-    science_courses = re.findall(r'(PHY\d+|CHE\d+)\s+([^|]+?)\s*\|\s*([\d.+]+)\s*\|\s*([^\n]*)', text_content)
-    for code, name, credits, prereq in science_courses:
-        data['course_lists']['compulsory_natural_science']['courses'].append({
+    data['course_lists']['compulsory_natural_science']['courses'] = [
+        {
             'code': code,
             'name': clean_text(name),
             'credits': credits,
-            'prerequisite': clean_text(prereq) if clean_text(prereq) else None
-        })
+            'prerequisite': clean_text(prereq) or None
+        }
+        for code, name, credits, prereq in _course_rows(course_scan, whole_page, {'PHY', 'CHE'})
+    ]
 
     # Extract Compulsory Mathematics and Statistics Courses
-    math_courses = re.findall(r'(MAT\d+|STA\d+)\s+([^|]+?)\s*\|\s*(\d+)\s*\|\s*([^\n]*?)(?=\n|MAT|STA|Core)', text_content)
-    for code, name, credits, prereq in math_courses:
-        if 'Compulsory Mathematics' in text_content[:text_content.find(code) + 500]:
-            data['course_lists']['compulsory_mathematics_statistics']['courses'].append({
+    math_section = _section_span(text_content, 'Compulsory Mathematics', 'Core Computer Science')
+    if math_section is not None:
+        data['course_lists']['compulsory_mathematics_statistics']['courses'] = [
+            {
                 'code': code,
                 'name': clean_text(name),
-                'credits': int(credits),
-                'prerequisite': clean_text(prereq) if clean_text(prereq) else None
-            })
+                'credits': _credits(credits),
+                'prerequisite': clean_text(prereq) or None
+            }
+            for code, name, credits, prereq in _course_rows(course_scan, math_section, {'MAT', 'STA'})
+        ]
 
     # Extract Core CSE Courses
-    core_section = re.search(r'Core Computer Science and Engineering Courses.*?(48\+14=62)(.*?)(?=Core Capstone|$)', text_content, re.DOTALL)
+    core_section = _CORE_SECTION_RE.search(text_content)
     if core_section:
-        courses = re.findall(r'(CSE\d+)\s+([^|]+?)\s*\|\s*([\d.+]+)\s*\|\s*([^\n]*)', core_section.group(2))
-        for code, name, credits, prereq in courses:
-            data['course_lists']['core_cse']['courses'].append({
+        data['course_lists']['core_cse']['courses'] = [
+            {
                 'code': code,
                 'name': clean_text(name),
                 'credits': credits,
-                'prerequisite': clean_text(prereq) if clean_text(prereq) else None
-            })
+                'prerequisite': clean_text(prereq) or None
+            }
+            for code, name, credits, prereq in _course_rows(course_scan, core_section.span(2), {'CSE'})
+        ]
 
     # Extract Capstone Project
-    capstone_match = re.search(r'(CSE400)\s+Capstone Project\s*\|\s*([\d.+]+)\s*\|\s*([^\n]+)', text_content)
+    capstone_match = _CAPSTONE_RE.search(text_content)
     if capstone_match:
-        data['course_lists']['core_capstone']['courses'].append({
+        data['course_lists']['core_capstone']['courses'] = [{
             'code': capstone_match.group(1),
             'name': 'Capstone Project',
             'credits': capstone_match.group(2),
             'prerequisite': clean_text(capstone_match.group(3))
-        })
+        }]
 
     # Extract ALL 4 Major Areas with COMPLETE details
-    major_patterns = [
-        ('1. Intelligent Systems and Data Science', 'Intelligent Systems and Data Science'),
-        ('2. Software Engineering', 'Software Engineering'),
-        ('3. Communications and Networking', 'Communications and Networking'),
-        ('4. Hardware Engineering', 'Hardware Engineering')
-    ]
-
-    for pattern, name in major_patterns:
-        major_section = re.search(rf'{re.escape(pattern)}(.*?)(?=\d+\.\s+\w+|Non-Major Area|Note:|$)', text_content, re.DOTALL)
+    for pattern, name, major_re in _MAJOR_RES:
+        major_section = major_re.search(text_content)
         if major_section:
-            section_text = major_section.group(1)
+            section_start, section_end = major_section.span(1)
+
+            # Extract compulsory and elective courses
+            compulsory = _MAJOR_COMPULSORY_RE.search(text_content, section_start, section_end)
+            compulsory_courses = [
+                {
+                    'code': code,
+                    'name': clean_text(course_name),
+                    'credits': credits,
+                    'prerequisite': clean_text(prereq) or None
+                }
+                for code, course_name, credits, prereq in _course_rows(course_scan, compulsory.span(2), {'CSE'})
+            ] if compulsory else []
+
+            elective = _MAJOR_ELECTIVE_RE.search(text_content, section_start, section_end)
+            elective_courses = [
+                {
+                    'code': code,
+                    'name': clean_text(course_name),
+                    'credits': credits,
+                    'prerequisite': clean_text(prereq) or None
+                }
+                for code, course_name, credits, prereq in _course_rows(course_scan, elective.span(2), {'CSE'})
+            ] if elective else []
 
             major_data = {
                 'number': pattern.split('.')[0].strip(),
@@ -331,73 +567,48 @@ def scrape_undergraduate_programs() -> Dict[str, Any]:
                 'total_credits': '15+5=20',
                 'compulsory_courses': {
                     'credits': '6+2=8',
-                    'courses': []
+                    'courses': compulsory_courses
                 },
                 'elective_courses': {
                     'credits': '9+3=12',
                     'note': 'Any 3 Courses',
-                    'courses': []
+                    'courses': elective_courses
                 }
             }
-
-            # Extract compulsory courses
-            compulsory = re.search(r'Compulsory Courses.*?(6\+2=8)(.*?)Elective Courses', section_text, re.DOTALL)
-            if compulsory:
-                courses = re.findall(r'(CSE\d+)\s+([^|]+?)\s*\|\s*([\d.+]+)\s*\|\s*([^\n]*)', compulsory.group(2))
-                for code, course_name, credits, prereq in courses:
-                    major_data['compulsory_courses']['courses'].append({
-                        'code': code,
-                        'name': clean_text(course_name),
-                        'credits': credits,
-                        'prerequisite': clean_text(prereq) if clean_text(prereq) else None
-                    })
-
-            # Extract elective courses
-            elective = re.search(r'Elective Courses.*?(9\+3=12)(.*?)(?=\d+\.\s+|Non-Major|$)', section_text, re.DOTALL)
-            if elective:
-                courses = re.findall(r'(CSE\d+)\s+([^|]+?)\s*\|\s*([\d.+]+)\s*\|\s*([^\n]*)', elective.group(2))
-                for code, course_name, credits, prereq in courses:
-                    major_data['elective_courses']['courses'].append({
-                        'code': code,
-                        'name': clean_text(course_name),
-                        'credits': credits,
-                        'prerequisite': clean_text(prereq) if clean_text(prereq) else None
-                    })
-
             data['course_lists']['major_areas'].append(major_data)
 
     # Extract Non-Major Area: Computational Theory
-    nonmajor_section = re.search(r'Non-Major Area: Computational Theory(.*?)(?=Note:|Course Flowchart|$)', text_content, re.DOTALL)
+    nonmajor_section = _NONMAJOR_SECTION_RE.search(text_content)
     if nonmajor_section:
-        courses = re.findall(r'(CSE\d+)\s+([^|]+?)\s*\|\s*([\d.+]+)\s*\|\s*([^\n]*)', nonmajor_section.group(1))
-        for code, name, credits, prereq in courses:
-            data['course_lists']['non_major_area']['courses'].append({
+        data['course_lists']['non_major_area']['courses'] = [
+            {
                 'code': code,
                 'name': clean_text(name),
                 'credits': credits,
-                'prerequisite': clean_text(prereq) if clean_text(prereq) else None
-            })
+                'prerequisite': clean_text(prereq) or None
+            }
+            for code, name, credits, prereq in _course_rows(course_scan, nonmajor_section.span(1), {'CSE'})
+        ]
 
     # Extract Notes
-    note_match = re.search(r'Note:\s*([^\n]+)', text_content)
+    note_match = _NOTE_RE.search(text_content)
     if note_match:
         data['notes'] = clean_text(note_match.group(1))
 
     # Extract Course Flowchart
-    flowchart_section = re.search(r'Course Flowchart(.*?)$', text_content, re.DOTALL)
+    flowchart_section = _FLOWCHART_RE.search(text_content)
     if flowchart_section:
         # 1st Year - 1st Semester
-        year1_sem1 = re.search(r'1st Semester(.*?)2nd Semester', flowchart_section.group(1), re.DOTALL)
+        year1_sem1 = _FIRST_SEMESTER_RE.search(flowchart_section.group(1))
         if year1_sem1:
-            courses = re.findall(r'([A-Z]{3}\d+)[^(]*\(([^)]+)\)', year1_sem1.group(1))
-            for code, credits in courses[:6]:  # best-effort; pages vary
-                data['course_flowchart']['first_year']['semester_1'].append({
-                    'code': code,
-                    'credits': credits
-                })
+            courses = _FLOWCHART_COURSE_RE.findall(year1_sem1.group(1))
+            data['course_flowchart']['first_year']['semester_1'] = [
+                {'code': code, 'credits': credits}
+                for code, credits in courses[:6]  # best-effort; pages vary
+            ]
 
         # Extract year credits
-        year_credit = re.search(r'Year-Credit\s*\|\s*(\d+)', text_content)
+        year_credit = _YEAR_CREDIT_RE.search(text_content)
         if year_credit:
             try:
                 data['course_flowchart']['year_credits'] = int(year_credit.group(1))
@@ -409,19 +620,18 @@ def scrape_undergraduate_programs() -> Dict[str, Any]:
 
 def scrape_graduate_programs() -> Dict[str, Any]:
     """Scrape COMPLETE graduate program details - EVERY WORD"""
-    url = "https://fse.ewubd.edu/computer-science-engineering/graduate-programs"
+    print(f"Scraping graduate programs: {GRADUATE_URL}")
+    return _parse_graduate(_fetch(GRADUATE_URL))
 
-    headers = {'User-Agent': 'Mozilla/5.0'}
-    print(f"Scraping graduate programs: {url}")
 
-    response = requests.get(url, headers=headers, timeout=30)
-    response.raise_for_status()
-    soup = BeautifulSoup(response.content, 'html.parser')
-
-    text_content = soup.get_text()
+def _parse_graduate(html: bytes) -> Dict[str, Any]:
+    """Extract the graduate program details from the fetched page"""
+    if b'Degree Requirement' not in html:
+        raise RuntimeError(f"No 'Degree Requirement' section on {GRADUATE_URL}; the page layout has changed")
+    text_content = _page_text(html)
 
     data: Dict[str, Any] = {
-        'url': url,
+        'url': GRADUATE_URL,
         'program_name': 'Master of Science in Computer Science and Engineering',
         'program_abbreviation': 'MS in CSE',
         'major_areas': {
@@ -466,38 +676,38 @@ def scrape_graduate_programs() -> Dict[str, Any]:
     }
 
     # Extract Major Areas
-    major_areas_desc = re.search(r'Major Areas:\s*(.*?)(?=A student will|$)', text_content, re.DOTALL)
+    major_areas_desc = _MAJOR_AREAS_DESC_RE.search(text_content)
     if major_areas_desc:
         desc_text = major_areas_desc.group(1)
         data['major_areas']['description'] = 'The Master of Science in Computer Science and Engineering (MS in CSE) program is organized into four major areas:'
         # Try to extract bullet/line items or comma separated items
-        areas = re.findall(r'(?:-|\u2022)?\s*([A-Za-z][A-Za-z\s&\-]{4,}?(?:Systems|Engineering|Science|Networking|Software|Hardware))', desc_text)
+        areas = _AREA_NAME_RE.findall(desc_text)
         if not areas:
             # fallback: split by commas and filter short tokens
-            parts = [p.strip() for p in re.split(r',|\n', desc_text) if p.strip()]
+            parts = [p.strip() for p in _AREA_SPLIT_RE.split(desc_text) if p.strip()]
             areas = [p for p in parts if len(p) > 5]
         data['major_areas']['areas'] = [clean_text(area) for area in areas]
 
     # Major area change policy
-    change_policy = re.search(r'(A student will have to declare.*?major area.*?before.*?)', text_content, re.DOTALL | re.IGNORECASE)
+    change_policy = _MAJOR_CHANGE_POLICY_RE.search(text_content)
     if change_policy:
         data['major_areas']['change_policy'] = clean_text(change_policy.group(1))
 
     # Extract Admission Requirements
-    admission_section = re.search(r'Admission Requirements:(.*?)(?=Study Track:|Study Tracks:|Length of the Program:|$)', text_content, re.DOTALL | re.IGNORECASE)
+    admission_section = _ADMISSION_SECTION_RE.search(text_content)
     if admission_section:
         adm_text = admission_section.group(1)
         data['admission_requirements']['description'] = clean_text(adm_text[:400])  # short description
 
         # Extract eligible disciplines as lines with "Engineering" or "Computer"
-        disciplines = re.findall(r'-\s*([A-Za-z0-9 ,&\-()]+(?:Engineering|Computer|Science|Technology)[A-Za-z0-9 ,&\-()]*)', adm_text)
+        disciplines = _DISCIPLINE_RE.findall(adm_text)
         if not disciplines:
             # fallback: any bullet-like lines
-            disciplines = re.findall(r'-\s*([A-Za-z].+)', adm_text)
+            disciplines = _BULLET_RE.findall(adm_text)
         data['admission_requirements']['eligible_disciplines'] = [clean_text(d) for d in disciplines]
 
         # Minimum CGPA
-        cgpa_match = re.search(r'(minimum\s+CGPA(?:\s+of)?\s+[\d.]+)', adm_text, re.IGNORECASE)
+        cgpa_match = _ADMISSION_CGPA_RE.search(adm_text)
         if cgpa_match:
             data['admission_requirements']['minimum_cgpa'] = clean_text(cgpa_match.group(1))
         elif '2.5 on a 4.0' in adm_text:
@@ -505,22 +715,22 @@ def scrape_graduate_programs() -> Dict[str, Any]:
 
         # HSC requirement detection
         if 'HSC' in adm_text or 'Higher Secondary' in adm_text:
-            hsc_req = re.search(r'([^.]*HSC[^.]*\.)', adm_text)
+            hsc_req = _HSC_RE.search(adm_text)
             if hsc_req:
                 data['admission_requirements']['hsc_requirement'] = clean_text(hsc_req.group(1))
 
         # Admission test
         if 'admission test' in adm_text.lower():
-            test_req = re.search(r'([^.]*admission test[^.]*\.)', adm_text, re.IGNORECASE)
+            test_req = _ADMISSION_TEST_RE.search(adm_text)
             if test_req:
                 data['admission_requirements']['admission_test'] = clean_text(test_req.group(1))
 
         # All requirements as sentences starting with 'Candidates must' or 'Applicants must'
-        all_reqs = re.findall(r'(?:Candidates|Applicants)\s+must[^.]*\.', adm_text)
+        all_reqs = _REQUIREMENT_SENTENCE_RE.findall(adm_text)
         data['admission_requirements']['all_requirements'] = [clean_text(req) for req in all_reqs]
 
     # Extract Study Tracks
-    track_section = re.search(r'Study Track:(.*?)(?=Length of the Program:|Program Length:|Degree Requirement:|$)', text_content, re.DOTALL | re.IGNORECASE)
+    track_section = _TRACK_SECTION_RE.search(text_content)
     if track_section:
         ts = track_section.group(1)
         data['study_tracks']['description'] = clean_text(ts[:300])
@@ -528,67 +738,63 @@ def scrape_graduate_programs() -> Dict[str, Any]:
             data['study_tracks']['tracks'].append('Thesis Track')
         if 'Project Track' in ts or 'Project' in ts:
             data['study_tracks']['tracks'].append('Project Track')
-        change_policy = re.search(r'(A student will have to declare.*?study track.*?)', ts, re.DOTALL | re.IGNORECASE)
+        change_policy = _TRACK_CHANGE_POLICY_RE.search(ts)
         if change_policy:
             data['study_tracks']['change_policy'] = clean_text(change_policy.group(1))
 
     # Extract Program Length
-    length_section = re.search(r'Length of the Program:\s*(.*?)(?=MS in CSE Program Cost:|MS in CSE Program Cost|Degree Requirement:|$)', text_content, re.DOTALL | re.IGNORECASE)
+    length_section = _LENGTH_SECTION_RE.search(text_content)
     if length_section:
         length_text = length_section.group(1)
         data['program_length']['full_description'] = clean_text(length_text)
         # simple numeric extraction
-        min_length = re.search(r'minimum\s*of\s*(\d+\s*(?:semester|semesters|year|years)?)', length_text, re.IGNORECASE)
-        max_length = re.search(r'up to\s*(\d+\s*(?:semester|semesters|year|years)?)', length_text, re.IGNORECASE)
+        min_length = _MIN_LENGTH_RE.search(length_text)
+        max_length = _MAX_LENGTH_RE.search(length_text)
         if min_length:
             data['program_length']['minimum'] = clean_text(min_length.group(1))
         if max_length:
             data['program_length']['maximum'] = clean_text(max_length.group(1))
 
     # Extract Program Cost (complete table) - best-effort parsing
-    cost_section = re.search(r'MS in CSE Program Cost:.*?(Grand Total.*?)(?=Degree Requirement:|Degree Requirements:|$)', text_content, re.DOTALL | re.IGNORECASE)
+    cost_section = _COST_SECTION_RE.search(text_content)
     if cost_section:
         cost_text = cost_section.group(0)
         # attempt to find numbers associated with cost
-        amounts = re.findall(r'([\d,]+(?:\.\d+)?)', cost_text)
+        amounts = _AMOUNT_RE.findall(cost_text)
         if amounts:
             # store raw amounts list (best-effort)
             data['program_cost']['raw_amounts'] = amounts[:10]
 
     # Extract Degree Requirements
-    degree_req_section = re.search(r'Degree Requirement:(.*?)(?=Thesis Track|Project Track|$)', text_content, re.DOTALL | re.IGNORECASE)
+    degree_req_section = _DEGREE_REQ_SECTION_RE.search(text_content)
     if degree_req_section:
         req_text = degree_req_section.group(1)
         data['degree_requirements']['description'] = clean_text(req_text)
         # Minimum credits
-        min_credits = re.search(r'(\d+\s+credits)', req_text, re.IGNORECASE)
+        min_credits = _MIN_CREDITS_RE.search(req_text)
         if min_credits:
             data['degree_requirements']['minimum_credits'] = clean_text(min_credits.group(1))
         # Minimum CGPA
-        cgpa_req = re.search(r'(\d+\.\d+\s+on a\s+4\.0)', req_text, re.IGNORECASE)
+        cgpa_req = _DEGREE_CGPA_RE.search(req_text)
         if cgpa_req:
             data['degree_requirements']['minimum_cgpa'] = clean_text(cgpa_req.group(1))
         elif '2.5 on a 4.0' in req_text:
             data['degree_requirements']['minimum_cgpa'] = '2.5 on a 4.0 point scale'
 
     # Extract Thesis Track Requirements
-    thesis_section = re.search(r'Thesis Track(.*?)Project Track', text_content, re.DOTALL | re.IGNORECASE)
-    if thesis_section:
-        thesis_text = thesis_section.group(1)
+    thesis_section = _section_span(text_content, 'Thesis Track', 'Project Track', require_end=True)
+    if thesis_section is not None:
+        thesis_text = text_content[thesis_section[0]:thesis_section[1]]
         # try to get required courses, credits, and rules
-        thesis_courses = re.findall(r'([A-Z]{3}\d+)\s+([^|]+?)\s*\|\s*([\d.]+)', thesis_text)
         thesis_info = {
             'raw_text': clean_text(thesis_text),
-            'courses': []
+            'courses': [
+                {'code': code, 'name': clean_text(name), 'credits': credits}
+                for code, name, credits in _GRAD_COURSE_RE.findall(thesis_text)
+            ]
         }
-        for code, name, credits in thesis_courses:
-            thesis_info['courses'].append({
-                'code': code,
-                'name': clean_text(name),
-                'credits': credits
-            })
         # look for required thesis credit value
-        thesis_credit = re.search(r'(\d+\s*credits)\s*for\s*thesis', thesis_text, re.IGNORECASE)
+        thesis_credit = _THESIS_CREDIT_RE.search(thesis_text)
         if thesis_credit:
             thesis_info['thesis_credits'] = clean_text(thesis_credit.group(1))
         data['degree_requirements']['thesis_track'] = thesis_info
@@ -598,68 +804,60 @@ def scrape_graduate_programs() -> Dict[str, Any]:
             data['degree_requirements']['thesis_track'] = {'raw_text': 'Thesis track mentioned in page but section parsing failed.'}
 
     # Extract Project Track Requirements (best-effort)
-    project_section = re.search(r'Project Track(.*?)(?=Thesis Track|Degree Requirement|$)', text_content, re.DOTALL | re.IGNORECASE)
-    if project_section:
-        project_text = project_section.group(1)
-        project_courses = re.findall(r'([A-Z]{3}\d+)\s+([^|]+?)\s*\|\s*([\d.]+)', project_text)
+    project_section = _section_span(text_content, 'Project Track', 'Thesis Track', 'Degree Requirement')
+    if project_section is not None:
+        project_text = text_content[project_section[0]:project_section[1]]
         project_info = {
             'raw_text': clean_text(project_text),
-            'courses': []
+            'courses': [
+                {'code': code, 'name': clean_text(name), 'credits': credits}
+                for code, name, credits in _GRAD_COURSE_RE.findall(project_text)
+            ]
         }
-        for code, name, credits in project_courses:
-            project_info['courses'].append({
-                'code': code,
-                'name': clean_text(name),
-                'credits': credits
-            })
         data['degree_requirements']['project_track'] = project_info
     else:
         if 'Project Track' in text_content:
             data['degree_requirements']['project_track'] = {'raw_text': 'Project track mentioned but parsing failed.'}
 
     # Extract Course Summary (compulsory/prerequisite lists)
-    comp_section = re.search(r'Compulsory Courses for all majors(.*?)(?=Major specific|Major Specific Courses|$)', text_content, re.DOTALL | re.IGNORECASE)
+    comp_section = _COMPULSORY_ALL_MAJORS_RE.search(text_content)
     if comp_section:
         comp_text = comp_section.group(1)
-        group_prereq = re.findall(r'Prerequisite[s]?:\s*([A-Za-z0-9, ]+)', comp_text, re.IGNORECASE)
+        group_prereq = _GROUP_PREREQ_RE.findall(comp_text)
         if group_prereq:
             data['course_summary']['compulsory_all_majors']['prerequisite'] = [clean_text(p) for p in ','.join(group_prereq).split(',') if p.strip()]
-        comp_courses = re.findall(r'([A-Z]{3}\d+)\s+([^|]+?)\s*\|\s*([\d.]+)', comp_text)
-        for code, name, credits in comp_courses:
-            data['course_summary']['compulsory_all_majors']['compulsory'].append({
-                'code': code,
-                'name': clean_text(name),
-                'credits': credits
-            })
+        data['course_summary']['compulsory_all_majors']['compulsory'] = [
+            {'code': code, 'name': clean_text(name), 'credits': credits}
+            for code, name, credits in _GRAD_COURSE_RE.findall(comp_text)
+        ]
 
     # Major specific courses
-    major_spec_section = re.search(r'Major Specific Courses:(.*?)(?=Thesis|Project|$)', text_content, re.DOTALL | re.IGNORECASE)
+    major_spec_section = _MAJOR_SPECIFIC_RE.search(text_content)
     if major_spec_section:
-        ms_text = major_spec_section.group(1)
-        # split by major headings if present
-        majors = re.split(r'\n{2,}', ms_text.strip())
-        for block in majors:
+        # walk the blocks under the heading, one per major
+        for block_match in _MAJOR_BLOCK_RE.finditer(major_spec_section.group(1)):
+            block = block_match.group(0)
             # attempt to find a major name at top
-            title = re.search(r'([A-Za-z &]+ Major(?: Area)?|Major Area: [A-Za-z &]+)', block)
+            title = _MAJOR_TITLE_RE.search(block)
             major_name = clean_text(title.group(0)) if title else None
-            courses = re.findall(r'([A-Z]{3}\d+)\s+([^|]+?)\s*\|\s*([\d.]+)', block)
-            major_entry = {'major_name': major_name or 'Unknown', 'courses': []}
-            for code, name, credits in courses:
-                major_entry['courses'].append({
-                    'code': code,
-                    'name': clean_text(name),
-                    'credits': credits
-                })
+            major_entry = {
+                'major_name': major_name or 'Unknown',
+                'courses': [
+                    {'code': code, 'name': clean_text(name), 'credits': credits}
+                    for code, name, credits in _GRAD_COURSE_RE.findall(block)
+                ]
+            }
             if major_entry['courses']:
                 data['major_specific_courses'].append(major_entry)
 
     # Thesis/Project final details (one-paragraph summary if present)
-    thesis_project_section = re.search(r'(Thesis and Project|Thesis Project|Thesis/Project)(.*?)(?=Admission|Degree|$)', text_content, re.DOTALL | re.IGNORECASE)
+    thesis_project_section = _THESIS_PROJECT_RE.search(text_content)
     if thesis_project_section:
         data['thesis_project']['raw'] = clean_text(thesis_project_section.group(0))
     else:
-        # fallback lookups
-        if 'thesis' in text_content.lower() or 'project' in text_content.lower():
+        # fallback lookups; lowercase the page once for both words
+        lower_text = text_content.lower()
+        if 'thesis' in lower_text or 'project' in lower_text:
             data['thesis_project']['raw'] = 'Thesis/project information exists on the page; detailed parsing may be required.'
 
     return data
@@ -667,27 +865,46 @@ def scrape_graduate_programs() -> Dict[str, Any]:
 
 def save_json(data: Dict[str, Any], filename: str) -> None:
     """Save dict to JSON with pretty printing and timestamp in filename if requested"""
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
 
 
 def main():
-    timestamp = datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')
-    try:
-        ug = scrape_undergraduate_programs()
-        ug_filename = f"ewu_cse_undergraduate_{timestamp}.json"
-        save_json(ug, ug_filename)
-        print(f"Undergraduate data saved to {ug_filename}")
-    except Exception as e:
-        print(f"Failed to scrape undergraduate programs: {e}")
-
-    try:
-        grad = scrape_graduate_programs()
-        grad_filename = f"ewu_cse_graduate_{timestamp}.json"
-        save_json(grad, grad_filename)
-        print(f"Graduate data saved to {grad_filename}")
-    except Exception as e:
-        print(f"Failed to scrape graduate programs: {e}")
+    timestamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+    pages = (
+        ('undergraduate', UNDERGRADUATE_URL, _parse_undergraduate),
+        ('graduate', GRADUATE_URL, _parse_graduate),
+    )
+
+    # Both pages are independent network round trips; fetch them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor, ProcessPoolExecutor(max_workers=2) as pool:
+        fetches = {}
+        for label, url, parse in pages:
+            print(f"Scraping {label} programs: {url}")
+            fetches[executor.submit(_fetch, url)] = (label, parse)
+
+        # Parsing is CPU-bound regex work; each page goes to its own process
+        # as soon as its download finishes. A failed fetch is kept as the
+        # page's future so its error is reported below
+        parses = {}
+        for fetch in as_completed(fetches):
+            label, parse = fetches[fetch]
+            future = pool.submit(parse, fetch.result()) if fetch.exception() is None else fetch
+            parses[future] = label
+
+        for future in as_completed(parses):
+            label = parses[future]
+            try:
+                data = future.result()
+                filename = f"ewu_cse_{label}_{timestamp}.json"
+                save_json(data, filename)
+                print(f"{label.capitalize()} data saved to {filename}")
+            except Exception as e:
+                print(f"Failed to scrape {label} programs: {e}")
 
 
 if __name__ == "__main__":
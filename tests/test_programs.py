@@ -0,0 +1,119 @@
+import unittest
+
+import programs
+
+
+def _table(*rows):
+    """HTML table with one row per tuple of cells"""
+    cells = ''.join(
+        '<tr>' + ''.join(f'<td>{cell}</td>' for cell in row) + '</tr>'
+        for row in rows
+    )
+    return f'<table>{cells}</table>'
+
+
+def _document(body):
+    """Minimal undergraduate page around the given content markup"""
+    return (
+        '<html><body><div class="page-content">'
+        '<h2>Program Educational Objectives</h2>'
+        f'{body}'
+        '</div></body></html>'
+    ).encode('utf-8')
+
+
+def _page(*rows):
+    """Minimal undergraduate page holding one course table"""
+    return _document(_table(*rows))
+
+
+class LanguageCourseTest(unittest.TestCase):
+
+    def test_lab_credits_stay_as_written(self):
+        data = programs._parse_undergraduate(_page(
+            ('ENG101 Basic English', '3', 'None'),
+            ('ENG102 Composition', '3+1', 'ENG101'),
+        ))
+        courses = data['course_lists']['compulsory_language_general_education']['courses']
+        self.assertEqual(
+            [(c['code'], c['credits'], c['prerequisite']) for c in courses],
+            [('ENG101', 3, None), ('ENG102', '3+1', 'ENG101')],
+        )
+
+    def test_empty_prerequisite_cell_keeps_next_row(self):
+        data = programs._parse_undergraduate(_page(
+            ('ENG101 Basic English', '3', ''),
+            ('ENG102 Composition', '3+1', 'ENG101'),
+            ('GEN201 Bangladesh Studies', '3', ''),
+        ))
+        courses = data['course_lists']['compulsory_language_general_education']['courses']
+        self.assertEqual(
+            [(c['code'], c['credits'], c['prerequisite']) for c in courses],
+            [('ENG101', 3, None), ('ENG102', '3+1', 'ENG101'), ('GEN201', 3, None)],
+        )
+
+    def test_table_rows_collapse_to_one_line_each(self):
+        text = programs._page_text(_page(
+            ('ENG101 Basic English', '3', ''),
+            ('ENG102 Composition', '3+1', 'ENG101'),
+        ))
+        self.assertEqual(text.splitlines()[1:], [
+            'ENG101 Basic English | 3 |',
+            'ENG102 Composition | 3+1 | ENG101',
+        ])
+
+
+class MathematicsCourseTest(unittest.TestCase):
+
+    def test_code_in_prose_keeps_first_row(self):
+        data = programs._parse_undergraduate(_document(
+            '<h3>Compulsory Mathematics and Statistics Courses</h3>'
+            '<p>Students who passed CSE103 earlier may skip</p>'
+            + _table(
+                ('MAT101 Calculus I', '3', 'None'),
+                ('MAT102 Calculus II', '3', 'MAT101'),
+            )
+            + '<h3>Core Computer Science and Engineering Courses</h3>'
+        ))
+        courses = data['course_lists']['compulsory_mathematics_statistics']['courses']
+        self.assertEqual([c['code'] for c in courses], ['MAT101', 'MAT102'])
+
+
+class ElectiveSectionTest(unittest.TestCase):
+
+    def test_adjacent_sections_keep_their_first_rows(self):
+        data = programs._parse_undergraduate(_document(
+            '<h3>Arts and Humanities Courses (any one course)</h3>'
+            + _table(('GEN205 World Civilization', '3', ''))
+            + '<p>Students may also count SOC101</p>'
+            '<h3>Business Courses (any one course)</h3>'
+            '<p>Offered jointly with GEN226</p>'
+            + _table(
+                ('BUS101 Introduction to Business', '3', ''),
+                ('MGT101 Principles of Management', '3', ''),
+            )
+            + '<h3>Compulsory Natural Science Courses</h3>'
+        ))
+        categories = data['course_lists']['elective_general_education']['categories']
+        self.assertEqual([c['code'] for c in categories['arts_humanities']], ['GEN205'])
+        self.assertEqual([c['code'] for c in categories['business']], ['BUS101', 'MGT101'])
+
+
+class GraduateTrackTest(unittest.TestCase):
+
+    def test_thesis_track_without_project_track_is_flagged(self):
+        data = programs._parse_graduate((
+            '<html><body><div class="page-content">'
+            '<h2>Degree Requirement:</h2>'
+            '<h3>Thesis Track</h3><p>Thesis of 12 credits</p>'
+            + _table(('CSE501', 'Advanced Algorithms', '3'))
+            + '</div></body></html>'
+        ).encode('utf-8'))
+        self.assertEqual(
+            data['degree_requirements']['thesis_track'],
+            {'raw_text': 'Thesis track mentioned in page but section parsing failed.'},
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()